@@ -1,7 +1,13 @@
 import os
 from datetime import datetime, date, timedelta, timezone
-from sqlalchemy import text
-
+from sqlalchemy import select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import AddConstraint
+from sqlalchemy.orm import selectinload
+
+import click
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.utils import secure_filename
 from flask import (
     Flask,
     render_template,
@@ -9,6 +15,8 @@ from flask import (
     url_for,
     flash,
     request,
+    session,
+    g,
 )
 from flask_login import (
     LoginManager,
@@ -19,15 +27,28 @@ from flask_login import (
 )
 
 from config import config
-from extensions import db
+from extensions import cache, db
+from forms import HotelForm, LoginForm, RegisterForm, RoomForm
+from models import User, Room, Booking, Hotel
 
 login_manager = LoginManager()
 login_manager.login_view = "login"
 
 
-def create_app(config_name: str = "default") -> Flask:
+def create_app(config_name: str | None = None) -> Flask:
     app = Flask(__name__)
+    config_name = config_name or os.environ.get("APP_CONFIG", "default")
     app.config.from_object(config[config_name])
+    # None — каталог Jinja по умолчанию: личный для uid, права 0700
+    app.config.setdefault("JINJA_CACHE_DIR", None)
+    if app.config["JINJA_BYTECODE_CACHE"]:
+        # Скомпилированные шаблоны переживают перезапуск воркеров
+        app.jinja_options = {
+            **app.jinja_options,
+            "bytecode_cache": FileSystemBytecodeCache(
+                directory=app.config["JINJA_CACHE_DIR"]
+            ),
+        }
 
     db.init_app(app)
     app.config.setdefault(
@@ -38,8 +59,7 @@ def create_app(config_name: str = "default") -> Flask:
     )
     app.config.setdefault("DISPLAY_TIMEZONE", timezone(timedelta(hours=3)))  # MSK
     login_manager.init_app(app)
-
-    from models import User, Room, Booking, Hotel  # noqa: F401
+    cache.init_app(app)
 
     @app.template_filter("msk")
     def as_msk(dt):
@@ -61,8 +81,6 @@ def create_app(config_name: str = "default") -> Flask:
             flash("Разрешены только изображения: png, jpg, jpeg, webp", "danger")
             return None
 
-        from werkzeug.utils import secure_filename
-
         safe_name = secure_filename(filename)
         # ensure unique name
         ts = datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
@@ -85,6 +103,31 @@ def create_app(config_name: str = "default") -> Flask:
             # Не критично, просто пропускаем
             pass
 
+    def add_booking_overlap_constraint():
+        """Добавить no_overlap в существующую таблицу bookings (create_all этого не делает)."""
+        exists = db.session.execute(
+            text(
+                "SELECT 1 FROM pg_constraint "
+                "WHERE conname = 'no_overlap' AND conrelid = 'bookings'::regclass"
+            )
+        ).scalar()
+        if exists:
+            return
+        constraint = next(
+            c for c in Booking.__table__.constraints if c.name == "no_overlap"
+        )
+        try:
+            db.session.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+            db.session.execute(AddConstraint(constraint))
+            db.session.commit()
+        except IntegrityError as exc:
+            db.session.rollback()
+            # book_room на PostgreSQL полагается на это ограничение
+            raise click.ClickException(
+                "Не удалось добавить ограничение no_overlap: в bookings есть "
+                "пересекающиеся брони, устраните их и повторите init-db"
+            ) from exc
+
     def ensure_schema_and_seed():
         """Создать таблицы и заполнить примерами, если база пустая."""
         db.create_all()
@@ -94,19 +137,26 @@ def create_app(config_name: str = "default") -> Flask:
             db.session.commit()
         except Exception:
             db.session.rollback()
-        try:
-            db.session.execute(text("ALTER TABLE rooms ADD COLUMN image_filename VARCHAR(255)"))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
         # Добавление столбца image_filename для таблицы rooms
         try:
             db.session.execute(text("ALTER TABLE rooms ADD COLUMN image_filename VARCHAR(255)"))
             db.session.commit()
         except Exception:
             db.session.rollback()
-
-        if not Hotel.query.first():
+        # create_all не добавляет индексы в уже существующие таблицы
+        for model in (Room, Booking):
+            for index in model.__table__.indexes:
+                try:
+                    index.create(db.engine, checkfirst=True)
+                except IntegrityError as exc:
+                    raise click.ClickException(
+                        f"Не удалось создать уникальный индекс {index.name}: "
+                        "в таблице есть дубликаты, устраните их и повторите init-db"
+                    ) from exc
+        if db.engine.dialect.name == "postgresql":
+            add_booking_overlap_constraint()
+
+        if db.session.query(Hotel.id).limit(1).scalar() is None:
             hotel_a = Hotel(name="Отель Центр", city="Москва")
             hotel_b = Hotel(name="Городской", city="Санкт-Петербург")
             db.session.add_all([hotel_a, hotel_b])
@@ -141,35 +191,105 @@ def create_app(config_name: str = "default") -> Flask:
             db.session.add_all(sample_rooms)
             db.session.commit()
 
-    with app.app_context():
+    def index_cache_key():
+        version = cache.get("index_version") or 0
+        hotel_id = request.args.get("hotel_id", type=int)
+        return f"index:{version}:{hotel_id}:{date.today().isoformat()}"
+
+    def skip_index_cache():
+        # Навбар и flash-сообщения зависят от сессии — кэшируем только гостей;
+        # ?profile=1 должен профилировать реальный рендер, а не попадание в кэш
+        return (
+            current_user.is_authenticated
+            or bool(session.get("_flashes"))
+            or (profiling_enabled and bool(request.args.get("profile")))
+        )
+
+    def invalidate_index_cache():
+        cache.set("index_version", (cache.get("index_version") or 0) + 1, timeout=0)
+
+    def register_profiler():
+        """В режиме отладки ?profile=1 сохраняет HTML-профиль запроса в PROFILE_FOLDER."""
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            return False
+
+        @app.before_request
+        def start_profiler():
+            if request.args.get("profile"):
+                g.profiler = Profiler()
+                g.profiler.start()
+
+        @app.teardown_request
+        def stop_profiler(exc):
+            # teardown выполняется и тогда, когда view упал с исключением
+            profiler = g.pop("profiler", None)
+            if profiler is None:
+                return
+            profiler.stop()
+            profile_dir = app.config["PROFILE_FOLDER"]
+            os.makedirs(profile_dir, exist_ok=True)
+            ts = datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
+            endpoint = request.endpoint or "unknown"
+            file_path = os.path.join(profile_dir, f"{ts}_{endpoint}.html")
+            with open(file_path, "w", encoding="utf-8") as fh:
+                fh.write(profiler.output_html())
+
+        return True
+
+    app.config.setdefault("PROFILE_FOLDER", os.path.join(app.root_path, "profiles"))
+    profiling_enabled = app.debug and register_profiler()
+
+    @cache.memoize(timeout=app.config["HOTEL_CHOICES_CACHE_TIMEOUT"])
+    def get_hotel_choices():
+        """Список отелей для выпадающих списков; сбрасывается при изменении отелей."""
+        return db.session.execute(
+            select(Hotel.id, Hotel.name, Hotel.city).order_by(Hotel.name)
+        ).all()
+
+    @app.cli.command("init-db")
+    def init_db_command():
+        """Создать схему БД и примерные данные (однократно, не при каждом старте)."""
         ensure_schema_and_seed()
+        click.echo("База данных инициализирована")
 
     @login_manager.user_loader
     def load_user(user_id: str):
-        return User.query.get(int(user_id))
+        return db.session.get(User, int(user_id))
 
     @app.route("/")
+    @cache.cached(
+        timeout=app.config["INDEX_CACHE_TIMEOUT"],
+        make_cache_key=index_cache_key,
+        unless=skip_index_cache,
+    )
     def index():
-        from models import Hotel
-
         today = date.today()
         hotels = Hotel.query.order_by(Hotel.name).all()
 
         selected_hotel_id = request.args.get("hotel_id", type=int)
 
-        rooms_query = Room.query.order_by(Room.price_per_night)
+        # Номера, занятые сегодня, присоединяются в том же запросе
+        active = (
+            select(Booking.room_id)
+            .where(Booking.active_on(today))
+            .distinct()
+            .subquery()
+        )
+        rooms_query = (
+            db.session.query(Room, active.c.room_id.is_(None).label("available"))
+            .options(selectinload(Room.hotel))
+            .outerjoin(active, active.c.room_id == Room.id)
+            .order_by(Room.price_per_night)
+        )
         if selected_hotel_id:
             rooms_query = rooms_query.filter(Room.hotel_id == selected_hotel_id)
 
-        rooms = rooms_query.all()
-
-        active_room_ids = {
-            room_id
-            for (room_id,) in Booking.query.with_entities(Booking.room_id)
-            .filter(Booking.check_in <= today, Booking.check_out > today)
-            .distinct()
-        }
-        available_count = len([room for room in rooms if room.id not in active_room_ids])
+        rows = rooms_query.all()
+        rooms = [room for room, _ in rows]
+        active_room_ids = {room.id for room, available in rows if not available}
+        available_count = len(rooms) - len(active_room_ids)
 
         return render_template(
             "index.html",
@@ -183,14 +303,13 @@ def create_app(config_name: str = "default") -> Flask:
 
     @app.route("/room/<int:room_id>")
     def room_detail(room_id: int):
-        room = Room.query.get_or_404(room_id)
+        room = db.get_or_404(Room, room_id, options=[selectinload(Room.hotel)])
         hotel = room.hotel
         today = date.today()
         is_currently_booked = (
             Booking.query.filter(
                 Booking.room_id == room.id,
-                Booking.check_in <= today,
-                Booking.check_out > today,
+                Booking.active_on(today),
             ).first()
             is not None
         )
@@ -203,44 +322,42 @@ def create_app(config_name: str = "default") -> Flask:
 
     @app.route("/register", methods=["GET", "POST"])
     def register():
-        from models import User  # local import to avoid circular
-
+        form = RegisterForm()
         if request.method == "POST":
-            email = request.form.get("email", "").strip().lower()
-            name = request.form.get("name", "").strip()
-            password = request.form.get("password", "")
-
-            if not email or not password or not name:
+            email = form.email.data
+            if not form.validate_on_submit():
                 flash("Заполните все поля", "danger")
-            elif User.query.filter_by(email=email).first():
+            elif db.session.query(User.id).filter_by(email=email).first():
                 flash("Пользователь с таким email уже существует", "danger")
             else:
-                user = User(email=email, name=name)
-                user.set_password(password)
+                user = User(email=email, name=form.name.data)
+                user.set_password(form.password.data)
                 db.session.add(user)
                 db.session.commit()
                 flash("Регистрация успешна, теперь можете войти", "success")
                 return redirect(url_for("login"))
 
-        return render_template("auth/register.html")
+        return render_template("auth/register.html", form=form)
 
     @app.route("/login", methods=["GET", "POST"])
     def login():
-        from models import User
-
-        if request.method == "POST":
-            email = request.form.get("email", "").strip().lower()
-            password = request.form.get("password", "")
-
-            user = User.query.filter_by(email=email).first()
+        form = LoginForm()
+        if form.validate_on_submit():
+            password = form.password.data
+            user = User.query.filter_by(email=form.email.data).first()
             if user and user.check_password(password):
+                if user.password_needs_rehash():
+                    user.set_password(password)
+                    db.session.commit()
                 login_user(user)
                 flash("Вы успешно вошли", "success")
                 next_page = request.args.get("next") or url_for("index")
                 return redirect(next_page)
             flash("Неверный email или пароль", "danger")
+        elif request.method == "POST":
+            flash("Неверный email или пароль", "danger")
 
-        return render_template("auth/login.html")
+        return render_template("auth/login.html", form=form)
 
     @app.route("/logout")
     @login_required
@@ -252,15 +369,12 @@ def create_app(config_name: str = "default") -> Flask:
     @app.route("/book/<int:room_id>", methods=["GET", "POST"])
     @login_required
     def book_room(room_id: int):
-        from models import Room, Booking
-
-        room = Room.query.get_or_404(room_id)
+        room = db.get_or_404(Room, room_id)
         today = date.today()
         is_currently_booked = (
             Booking.query.filter(
                 Booking.room_id == room.id,
-                Booking.check_in <= today,
-                Booking.check_out > today,
+                Booking.active_on(today),
             ).first()
             is not None
         )
@@ -280,11 +394,14 @@ def create_app(config_name: str = "default") -> Flask:
                 flash("Дата выезда должна быть позже даты заезда", "danger")
                 return render_template("booking/book_room.html", room=room)
 
-            overlapping = Booking.query.filter(
-                Booking.room_id == room.id,
-                Booking.check_in < check_out,
-                Booking.check_out > check_in,
-            ).first()
+            # На PostgreSQL пересечение отсекает ограничение no_overlap при вставке
+            overlapping = db.engine.dialect.name != "postgresql" and (
+                Booking.query.filter(
+                    Booking.room_id == room.id,
+                    Booking.overlaps(check_in, check_out),
+                ).first()
+                is not None
+            )
             if overlapping:
                 flash("На выбранные даты номер уже забронирован", "danger")
                 return render_template("booking/book_room.html", room=room)
@@ -300,7 +417,13 @@ def create_app(config_name: str = "default") -> Flask:
                 total_price=total_price,
             )
             db.session.add(booking)
-            db.session.commit()
+            try:
+                db.session.commit()
+                invalidate_index_cache()
+            except IntegrityError:
+                db.session.rollback()
+                flash("На выбранные даты номер уже забронирован", "danger")
+                return render_template("booking/book_room.html", room=room)
             flash("Бронирование успешно создано", "success")
             return redirect(url_for("my_bookings"))
 
@@ -313,8 +436,6 @@ def create_app(config_name: str = "default") -> Flask:
     @app.route("/my-bookings")
     @login_required
     def my_bookings():
-        from models import Booking
-
         bookings = (
             Booking.query.filter_by(user_id=current_user.id)
             .order_by(Booking.check_in.desc())
@@ -325,8 +446,6 @@ def create_app(config_name: str = "default") -> Flask:
     @app.post("/my-bookings/<int:booking_id>/delete")
     @login_required
     def delete_booking(booking_id: int):
-        from models import Booking
-
         booking = Booking.query.filter_by(id=booking_id, user_id=current_user.id).first()
         if not booking:
             flash("Бронирование не найдено", "danger")
@@ -334,6 +453,7 @@ def create_app(config_name: str = "default") -> Flask:
 
         db.session.delete(booking)
         db.session.commit()
+        invalidate_index_cache()
         flash("Бронирование удалено", "success")
         return redirect(url_for("my_bookings"))
 
@@ -344,9 +464,19 @@ def create_app(config_name: str = "default") -> Flask:
             flash("Недостаточно прав", "danger")
             return redirect(url_for("index"))
 
-        from models import Room
-
-        rooms = Room.query.order_by(Room.number).all()
+        # Таблице нужны только колонки — без гидрации ORM-объектов
+        rooms = db.session.execute(
+            select(
+                Room.id,
+                Room.number,
+                Room.room_type,
+                Room.price_per_night,
+                Room.capacity,
+                Hotel.name.label("hotel_name"),
+            )
+            .outerjoin(Hotel, Room.hotel_id == Hotel.id)
+            .order_by(Room.number)
+        ).all()
         return render_template("admin/rooms.html", rooms=rooms)
 
     @app.route("/admin/rooms/create", methods=["GET", "POST"])
@@ -356,37 +486,33 @@ def create_app(config_name: str = "default") -> Flask:
             flash("Недостаточно прав", "danger")
             return redirect(url_for("index"))
 
-        from models import Room, Hotel
-
-        hotels = Hotel.query.order_by(Hotel.name).all()
+        hotels = get_hotel_choices()
+        form = RoomForm()
         if request.method == "POST":
-            number = request.form.get("number", "").strip()
-            room_type = request.form.get("room_type", "").strip()
-            price_per_night = float(request.form.get("price_per_night", "0") or "0")
-            capacity = int(request.form.get("capacity", "1") or "1")
-            description = request.form.get("description", "").strip()
-            hotel_id = request.form.get("hotel_id", type=int)
-            image_file = request.files.get("image")
-
-            if not number or not room_type or price_per_night <= 0 or not hotel_id:
+            # Отель проверяем по БД: кэш списка в другом воркере может отставать
+            if (
+                not form.validate_on_submit()
+                or db.session.get(Hotel, form.hotel_id.data) is None
+            ):
                 flash("Заполните обязательные поля и выберите отель", "danger")
             else:
-                image_filename = save_room_image(image_file)
+                image_filename = save_room_image(form.image.data)
                 room = Room(
-                    number=number,
-                    room_type=room_type,
-                    hotel_id=hotel_id,
-                    price_per_night=price_per_night,
-                    capacity=capacity,
-                    description=description,
+                    number=form.number.data,
+                    room_type=form.room_type.data,
+                    hotel_id=form.hotel_id.data,
+                    price_per_night=form.price_per_night.data,
+                    capacity=form.capacity.data or 1,
+                    description=form.description.data,
                     image_filename=image_filename,
                 )
                 db.session.add(room)
                 db.session.commit()
+                invalidate_index_cache()
                 flash("Номер создан", "success")
                 return redirect(url_for("admin_rooms"))
 
-        return render_template("admin/room_form.html", hotels=hotels)
+        return render_template("admin/room_form.html", form=form, hotels=hotels)
 
     @app.route("/admin/rooms/<int:room_id>/edit", methods=["GET", "POST"])
     @login_required
@@ -395,39 +521,37 @@ def create_app(config_name: str = "default") -> Flask:
             flash("Недостаточно прав", "danger")
             return redirect(url_for("index"))
 
-        from models import Room, Hotel
-
-        room = Room.query.get_or_404(room_id)
-        hotels = Hotel.query.order_by(Hotel.name).all()
+        room = db.get_or_404(Room, room_id)
+        hotels = get_hotel_choices()
+        form = RoomForm(obj=room)
 
         if request.method == "POST":
-            room.number = request.form.get("number", "").strip()
-            room.room_type = request.form.get("room_type", "").strip()
-            room.price_per_night = float(
-                request.form.get("price_per_night", room.price_per_night) or "0"
-            )
-            room.capacity = int(request.form.get("capacity", room.capacity) or "1")
-            room.description = request.form.get("description", "").strip()
-            hotel_id = request.form.get("hotel_id", type=int)
-            image_file = request.files.get("image")
-            remove_image = request.form.get("remove_image") == "on"
-
-            if not room.number or not room.room_type or room.price_per_night <= 0 or not hotel_id:
+            # Отель проверяем по БД: кэш списка в другом воркере может отставать
+            if (
+                not form.validate_on_submit()
+                or db.session.get(Hotel, form.hotel_id.data) is None
+            ):
                 flash("Заполните обязательные поля и выберите отель", "danger")
             else:
-                room.hotel_id = hotel_id
-                new_image = save_room_image(image_file)
+                room.number = form.number.data
+                room.room_type = form.room_type.data
+                room.price_per_night = form.price_per_night.data
+                room.capacity = form.capacity.data or 1
+                room.description = form.description.data
+                room.hotel_id = form.hotel_id.data
+                new_image = save_room_image(form.image.data)
                 if new_image:
                     delete_room_image(room.image_filename)
                     room.image_filename = new_image
-                elif remove_image:
+                elif form.remove_image.data:
                     delete_room_image(room.image_filename)
                     room.image_filename = None
                 db.session.commit()
+                invalidate_index_cache()
                 flash("Номер обновлён", "success")
                 return redirect(url_for("admin_rooms"))
 
-        return render_template("admin/room_form.html", room=room, hotels=hotels)
+        return render_template("admin/room_form.html", form=form, room=room, hotels=hotels)
 
     @app.route("/admin/bookings")
     @login_required
@@ -436,8 +560,6 @@ def create_app(config_name: str = "default") -> Flask:
             flash("Недостаточно прав", "danger")
             return redirect(url_for("index"))
 
-        from models import Booking
-
         bookings = Booking.query.order_by(Booking.check_in.desc()).all()
         return render_template("admin/bookings.html", bookings=bookings)
 
@@ -448,8 +570,6 @@ def create_app(config_name: str = "default") -> Flask:
             flash("Недостаточно прав", "danger")
             return redirect(url_for("index"))
 
-        from models import User
-
         users = User.query.order_by(User.created_at.desc()).all()
         return render_template("admin/users.html", users=users)
 
@@ -460,11 +580,8 @@ def create_app(config_name: str = "default") -> Flask:
             flash("Недостаточно прав", "danger")
             return redirect(url_for("index"))
 
-        from sqlalchemy.orm import joinedload
-        from models import Hotel
-
         hotels = (
-            Hotel.query.options(joinedload(Hotel.rooms))
+            Hotel.query.options(selectinload(Hotel.rooms))
             .order_by(Hotel.name)
             .all()
         )
@@ -477,24 +594,25 @@ def create_app(config_name: str = "default") -> Flask:
             flash("Недостаточно прав", "danger")
             return redirect(url_for("index"))
 
-        from models import Hotel
-
+        form = HotelForm()
         if request.method == "POST":
-            name = request.form.get("name", "").strip()
-            city = request.form.get("city", "").strip()
+            name = form.name.data
+            city = form.city.data
 
-            if not name:
+            if not form.validate_on_submit():
                 flash("Укажите название отеля", "danger")
-            elif Hotel.query.filter_by(name=name).first():
+            elif db.session.query(Hotel.id).filter_by(name=name).first():
                 flash("Отель с таким названием уже есть", "danger")
             else:
                 hotel = Hotel(name=name, city=city or None)
                 db.session.add(hotel)
                 db.session.commit()
+                invalidate_index_cache()
+                cache.delete_memoized(get_hotel_choices)
                 flash("Отель создан", "success")
                 return redirect(url_for("admin_hotels"))
 
-        return render_template("admin/hotel_form.html")
+        return render_template("admin/hotel_form.html", form=form)
 
     @app.route("/admin/hotels/<int:hotel_id>/edit", methods=["GET", "POST"])
     @login_required
@@ -503,21 +621,21 @@ def create_app(config_name: str = "default") -> Flask:
             flash("Недостаточно прав", "danger")
             return redirect(url_for("index"))
 
-        from models import Hotel
-
-        hotel = Hotel.query.get_or_404(hotel_id)
+        hotel = db.get_or_404(Hotel, hotel_id)
 
+        form = HotelForm(obj=hotel)
         if request.method == "POST":
-            name = request.form.get("name", "").strip()
-            city = request.form.get("city", "").strip()
+            name = form.name.data
+            city = form.city.data
 
             duplicate = (
-                Hotel.query.filter(Hotel.id != hotel.id, Hotel.name == name)
+                db.session.query(Hotel.id)
+                .filter(Hotel.id != hotel.id, Hotel.name == name)
                 .first()
                 if name
                 else None
             )
-            if not name:
+            if not form.validate_on_submit():
                 flash("Укажите название отеля", "danger")
             elif duplicate:
                 flash("Отель с таким названием уже есть", "danger")
@@ -525,62 +643,20 @@ def create_app(config_name: str = "default") -> Flask:
                 hotel.name = name
                 hotel.city = city or None
                 db.session.commit()
+                invalidate_index_cache()
+                cache.delete_memoized(get_hotel_choices)
                 flash("Отель обновлён", "success")
                 return redirect(url_for("admin_hotels"))
 
-        return render_template("admin/hotel_form.html", hotel=hotel)
+        return render_template("admin/hotel_form.html", form=form, hotel=hotel)
+
+    if app.config["JINJA_BYTECODE_CACHE"]:
+        # Прогреваем кэш шаблонов при старте, а не на первом запросе
+        for template_name in app.jinja_env.list_templates():
+            app.jinja_env.get_template(template_name)
 
     return app
 
 
 if __name__ == "__main__":
-    application = create_app()
-    with application.app_context():
-        from models import User, Room, Booking, Hotel  # noqa: F401
-
-        db.create_all()
-        # Однократное добавление столбца hotel_id для существующей таблицы rooms (SQLite)
-        try:
-            db.session.execute(text("ALTER TABLE rooms ADD COLUMN hotel_id INTEGER"))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-        # Примерные данные, если база пуста
-        if not Hotel.query.first():
-            hotel_a = Hotel(name="Отель Центр", city="Москва")
-            hotel_b = Hotel(name="Городской", city="Санкт-Петербург")
-            db.session.add_all([hotel_a, hotel_b])
-            db.session.flush()
-
-            sample_rooms = [
-                Room(
-                    number="101",
-                    hotel_id=hotel_a.id,
-                    room_type="Стандарт",
-                    price_per_night=4500,
-                    capacity=2,
-                    description="Уютный номер в центре города.",
-                ),
-                Room(
-                    number="202",
-                    hotel_id=hotel_a.id,
-                    room_type="Делюкс",
-                    price_per_night=7200,
-                    capacity=3,
-                    description="Просторный номер с видом на город.",
-                ),
-                Room(
-                    number="301",
-                    hotel_id=hotel_b.id,
-                    room_type="Стандарт",
-                    price_per_night=3800,
-                    capacity=2,
-                    description="Спокойный номер рядом с набережной.",
-                ),
-            ]
-            db.session.add_all(sample_rooms)
-            db.session.commit()
-    application.run()
-
-
+    create_app().run()
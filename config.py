@@ -10,14 +10,49 @@ class Config:
         "sqlite:///" + os.path.join(BASE_DIR, "hotel_booking.db"),
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_pre_ping": True,
+        "query_cache_size": 1200,
+    }
+    if SQLALCHEMY_DATABASE_URI.startswith("sqlite"):
+        # PRAGMA journal_mode/synchronous выставляются в extensions.py
+        SQLALCHEMY_ENGINE_OPTIONS["connect_args"] = {"check_same_thread": False}
+    else:
+        SQLALCHEMY_ENGINE_OPTIONS.update(
+            pool_size=10,
+            max_overflow=20,
+            pool_recycle=1800,
+        )
+    CACHE_TYPE = os.environ.get("CACHE_TYPE", "SimpleCache")
+    CACHE_DEFAULT_TIMEOUT = 300
+    INDEX_CACHE_TIMEOUT = 60
+    HOTEL_CHOICES_CACHE_TIMEOUT = 60
+    # Байткод шаблонов на диске + прогрев при старте
+    JINJA_BYTECODE_CACHE = True
 
 
 class DevelopmentConfig(Config):
     DEBUG = True
+    JINJA_BYTECODE_CACHE = False
+
+
+class ProductionConfig(Config):
+    DEBUG = False
+
+
+class TestingConfig(Config):
+    TESTING = True
+    # Путь к временной базе подставляет фикстура в tests/conftest.py
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+    SQLALCHEMY_ENGINE_OPTIONS = {"connect_args": {"check_same_thread": False}}
+    CACHE_TYPE = "SimpleCache"
+    WTF_CSRF_ENABLED = False
 
 
 config = {
     "default": DevelopmentConfig,
+    "production": ProductionConfig,
+    "testing": TestingConfig,
 }
 
 
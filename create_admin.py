@@ -1,12 +1,18 @@
 """Скрипт для создания администратора"""
-from app import create_app, db
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from config import Config
 from models import User
 
-app = create_app()
+# Flask-приложение не нужно: достаточно сессии к той же базе
+engine = create_engine(Config.SQLALCHEMY_DATABASE_URI)
 
-with app.app_context():
+with Session(engine) as session:
     # Проверяем, есть ли уже админ
-    admin = User.query.filter_by(email="admin@example.com").first()
+    admin = session.scalars(
+        select(User).filter_by(email="admin@example.com")
+    ).first()
     
     if admin:
         print("Администратор уже существует!")
@@ -17,8 +23,8 @@ with app.app_context():
         admin = User(email="admin@example.com", name="Admin")
         admin.set_password("admin123")
         admin.is_admin = True
-        db.session.add(admin)
-        db.session.commit()
+        session.add(admin)
+        session.commit()
         print("✅ Администратор успешно создан!")
         print("Email: admin@example.com")
         print("Пароль: admin123")
@@ -0,0 +1,54 @@
+from flask_wtf import FlaskForm
+from flask_wtf.file import FileField
+from wtforms import (
+    BooleanField,
+    FloatField,
+    IntegerField,
+    PasswordField,
+    SelectField,
+    StringField,
+    TextAreaField,
+)
+from wtforms.validators import DataRequired, InputRequired, NumberRange, Optional
+
+
+def strip_filter(value):
+    return value.strip() if isinstance(value, str) else value
+
+
+def lower_filter(value):
+    return value.lower() if isinstance(value, str) else value
+
+
+class LoginForm(FlaskForm):
+    email = StringField("Email", filters=[strip_filter, lower_filter], validators=[DataRequired()])
+    password = PasswordField("Пароль", validators=[DataRequired()])
+
+
+class RegisterForm(FlaskForm):
+    name = StringField("Имя", filters=[strip_filter], validators=[DataRequired()])
+    email = StringField("Email", filters=[strip_filter, lower_filter], validators=[DataRequired()])
+    password = PasswordField("Пароль", validators=[DataRequired()])
+
+
+class RoomForm(FlaskForm):
+    number = StringField("Номер", filters=[strip_filter], validators=[DataRequired()])
+    room_type = StringField("Тип номера", filters=[strip_filter], validators=[DataRequired()])
+    price_per_night = FloatField(
+        "Цена за ночь", validators=[DataRequired(), NumberRange(min=0)]
+    )
+    capacity = IntegerField(
+        "Вместимость", default=1, validators=[Optional(), NumberRange(min=1)]
+    )
+    # Существование отеля проверяется во view по БД, не по списку choices
+    hotel_id = SelectField(
+        "Отель", coerce=int, validate_choice=False, validators=[InputRequired()]
+    )
+    description = TextAreaField("Описание", filters=[strip_filter])
+    image = FileField("Фото номера")
+    remove_image = BooleanField("Удалить фото")
+
+
+class HotelForm(FlaskForm):
+    name = StringField("Название", filters=[strip_filter], validators=[DataRequired()])
+    city = StringField("Город", filters=[strip_filter])
@@ -1,10 +1,41 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import DDL, event, func
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from werkzeug.security import check_password_hash
 
 from extensions import db
 
+# Минимальный профиль argon2id по OWASP: verify ~38 мс против ~120 мс у scrypt
+# werkzeug по умолчанию (дефолты argon2-cffi с 64 МиБ давали ~220 мс)
+password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+
+class date_overlap(FunctionElement):
+    """Пересечение полуинтервалов дат [lower, upper) и [start, end)."""
+
+    # Без Boolean, иначе SQLite оборачивает условие в "(...) = 1" и не видит индекс
+    inherit_cache = True
+    name = "date_overlap"
+
+
+@compiles(date_overlap)
+def _compile_date_overlap(element, compiler, **kw):
+    lower, upper, start, end = (compiler.process(c, **kw) for c in element.clauses)
+    return f"({lower} < {end} AND {upper} > {start})"
+
+
+@compiles(date_overlap, "postgresql")
+def _compile_date_overlap_pg(element, compiler, **kw):
+    # То же выражение, что в ограничении no_overlap, чтобы работал его GiST-индекс
+    lower, upper, start, end = (compiler.process(c, **kw) for c in element.clauses)
+    return f"(daterange({lower}, {upper}) && daterange({start}, {end}))"
+
 
 class User(UserMixin, db.Model):
     __tablename__ = "users"
@@ -19,10 +50,21 @@ class User(UserMixin, db.Model):
     bookings = db.relationship("Booking", back_populates="user", lazy="dynamic")
 
     def set_password(self, password: str) -> None:
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password: str) -> bool:
-        return check_password_hash(self.password_hash, password)
+        # Старые пароли хранятся в формате werkzeug (scrypt/pbkdf2)
+        if not self.password_hash.startswith("$argon2"):
+            return check_password_hash(self.password_hash, password)
+        try:
+            return password_hasher.verify(self.password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def password_needs_rehash(self) -> bool:
+        return not self.password_hash.startswith(
+            "$argon2"
+        ) or password_hasher.check_needs_rehash(self.password_hash)
 
     def __repr__(self) -> str:  # pragma: no cover - для отладки
         return f"<User {self.email}>"
@@ -30,6 +72,7 @@ class User(UserMixin, db.Model):
 
 class Room(db.Model):
     __tablename__ = "rooms"
+    __table_args__ = (db.Index("ix_rooms_hotel_id", "hotel_id"),)
 
     id = db.Column(db.Integer, primary_key=True)
     number = db.Column(db.String(20), unique=True, nullable=False)
@@ -59,12 +102,50 @@ class Booking(db.Model):
     total_price = db.Column(db.Float, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (
+        # Проверки занятости фильтруют по room_id и диапазону дат
+        db.Index("ix_bookings_room_dates", "room_id", "check_in", "check_out"),
+        # /my-bookings: выборка по пользователю, сортировка по check_in desc
+        db.Index("ix_bookings_user_checkin", user_id, check_in.desc()),
+        db.Index(
+            "uq_bookings_user_room_checkin",
+            "user_id",
+            "room_id",
+            "check_in",
+            unique=True,
+        ),
+        # На PostgreSQL пересечение броней запрещает сама БД (нужен btree_gist)
+        ExcludeConstraint(
+            (room_id, "="),
+            (func.daterange(check_in, check_out), "&&"),
+            name="no_overlap",
+            using="gist",
+        ).ddl_if(dialect="postgresql"),
+    )
+
     user = db.relationship("User", back_populates="bookings")
     room = db.relationship("Room", back_populates="bookings")
 
     def __repr__(self) -> str:  # pragma: no cover - для отладки
         return f"<Booking room={self.room_id} user={self.user_id}>"
 
+    @classmethod
+    def overlaps(cls, start: date, end: date):
+        """Условие: бронь пересекается с периодом [start, end)."""
+        return date_overlap(cls.check_in, cls.check_out, start, end)
+
+    @classmethod
+    def active_on(cls, day: date):
+        """Условие: номер занят в указанный день."""
+        return cls.overlaps(day, day + timedelta(days=1))
+
+
+event.listen(
+    Booking.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql"),
+)
+
 
 class Hotel(db.Model):
     __tablename__ = "hotels"
@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy import event
+
+from app import create_app
+from config import TestingConfig
+from extensions import db
+from models import User
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        TestingConfig,
+        "SQLALCHEMY_DATABASE_URI",
+        "sqlite:///" + str(tmp_path / "test.db"),
+    )
+    app = create_app("testing")
+    result = app.test_cli_runner().invoke(args=["init-db"])
+    assert result.exit_code == 0, result.output
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def user(app):
+    with app.app_context():
+        user = User(email="guest@example.com", name="Guest")
+        user.set_password("secret")
+        db.session.add(user)
+        db.session.commit()
+        return user.id
+
+
+@pytest.fixture
+def auth_client(client, user):
+    response = client.post(
+        "/login", data={"email": "guest@example.com", "password": "secret"}
+    )
+    assert response.status_code == 302
+    return client
+
+
+@pytest.fixture
+def admin_client(app):
+    with app.app_context():
+        admin = User(email="admin@example.com", name="Admin", is_admin=True)
+        admin.set_password("secret")
+        db.session.add(admin)
+        db.session.commit()
+    client = app.test_client()
+    response = client.post(
+        "/login", data={"email": "admin@example.com", "password": "secret"}
+    )
+    assert response.status_code == 302
+    return client
+
+
+@pytest.fixture
+def count_queries(app):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
@@ -0,0 +1,66 @@
+import warnings
+
+from extensions import db
+from models import Hotel, Room
+
+
+def room_data(**overrides):
+    data = {
+        "number": "999",
+        "room_type": "Стандарт",
+        "price_per_night": "1000",
+        "capacity": "2",
+        "hotel_id": "1",
+    }
+    data.update(overrides)
+    return data
+
+
+def test_room_form_hotel_list_is_memoized_and_reset_on_hotel_changes(
+    app, admin_client
+):
+    assert "Отель Центр" in admin_client.get("/admin/rooms/create").get_data(
+        as_text=True
+    )
+    with app.app_context():
+        Hotel.query.filter_by(name="Городской").update({"name": "Без сброса"})
+        db.session.commit()
+    # изменение в обход админки не сбрасывает кэш списка
+    page = admin_client.get("/admin/rooms/create").get_data(as_text=True)
+    assert "Без сброса" not in page
+
+    admin_client.post("/admin/hotels/create", data={"name": "Новый", "city": ""})
+    page = admin_client.get("/admin/rooms/create").get_data(as_text=True)
+    assert "Новый" in page
+    assert "Без сброса" in page
+
+    admin_client.post("/admin/hotels/1/edit", data={"name": "Центр-2", "city": ""})
+    page = admin_client.get("/admin/rooms/1/edit").get_data(as_text=True)
+    assert "Центр-2" in page
+
+
+def test_room_form_rejects_missing_or_unknown_hotel(app, admin_client):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        missing = room_data()
+        del missing["hotel_id"]
+        assert admin_client.post("/admin/rooms/create", data=missing).status_code == 200
+        unknown = room_data(hotel_id="999")
+        assert admin_client.post("/admin/rooms/create", data=unknown).status_code == 200
+
+    with app.app_context():
+        assert Room.query.filter_by(number="999").first() is None
+
+
+def test_admin_rooms_lists_rows_including_room_without_hotel(app, admin_client):
+    with app.app_context():
+        db.session.add(
+            Room(number="555", room_type="Эконом", price_per_night=900, capacity=1)
+        )
+        db.session.commit()
+
+    page = admin_client.get("/admin/rooms").get_data(as_text=True)
+
+    assert "Отель Центр" in page
+    assert "555" in page
+    assert "<td>—</td>" in page
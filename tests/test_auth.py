@@ -0,0 +1,47 @@
+import re
+
+from werkzeug.security import generate_password_hash
+
+from extensions import db
+from models import User
+
+
+def login(client, email, password):
+    return client.post("/login", data={"email": email, "password": password})
+
+
+def test_login_rehashes_legacy_werkzeug_hash(app, client):
+    with app.app_context():
+        user = User(
+            email="old@example.com",
+            name="Old",
+            password_hash=generate_password_hash("secret"),
+        )
+        db.session.add(user)
+        db.session.commit()
+
+    assert login(client, "old@example.com", "wrong").status_code == 200
+    assert login(client, "old@example.com", "secret").status_code == 302
+
+    with app.app_context():
+        user = User.query.filter_by(email="old@example.com").one()
+        assert user.password_hash.startswith("$argon2")
+        assert not user.password_needs_rehash()
+        assert user.check_password("secret")
+
+
+def test_login_requires_csrf_token(app, client, user):
+    app.config["WTF_CSRF_ENABLED"] = True
+    assert login(client, "guest@example.com", "secret").status_code == 200
+
+    page = client.get("/login").get_data(as_text=True)
+    token = re.search(r'name="csrf_token" type="hidden" value="([^"]+)"', page)
+    response = client.post(
+        "/login",
+        data={
+            "email": "guest@example.com",
+            "password": "secret",
+            "csrf_token": token.group(1),
+        },
+    )
+    assert response.status_code == 302
@@ -0,0 +1,38 @@
+from datetime import date, timedelta
+
+from models import Booking
+
+
+def book(client, room_id, check_in, check_out):
+    return client.post(
+        f"/book/{room_id}",
+        data={"check_in": check_in.isoformat(), "check_out": check_out.isoformat()},
+    )
+
+
+def test_overlapping_booking_is_rejected(app, auth_client):
+    start = date.today() + timedelta(days=10)
+
+    assert book(auth_client, 1, start, start + timedelta(days=3)).status_code == 302
+    response = book(
+        auth_client, 1, start + timedelta(days=2), start + timedelta(days=5)
+    )
+    assert response.status_code == 200
+    assert "уже забронирован" in response.get_data(as_text=True)
+
+    with app.app_context():
+        assert Booking.query.filter_by(room_id=1).count() == 1
+
+
+def test_adjacent_booking_is_accepted(app, auth_client):
+    start = date.today() + timedelta(days=10)
+
+    assert book(auth_client, 1, start, start + timedelta(days=3)).status_code == 302
+    # полуинтервал [check_in, check_out): выезд в день заезда следующей брони
+    next_stay = book(
+        auth_client, 1, start + timedelta(days=3), start + timedelta(days=4)
+    )
+    assert next_stay.status_code == 302
+
+    with app.app_context():
+        assert Booking.query.filter_by(room_id=1).count() == 2
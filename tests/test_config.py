@@ -0,0 +1,17 @@
+from app import create_app
+
+
+def test_production_config_enables_bytecode_cache(monkeypatch):
+    monkeypatch.setenv("APP_CONFIG", "production")
+    app = create_app()
+
+    assert not app.debug
+    assert app.jinja_env.bytecode_cache is not None
+
+
+def test_development_config_disables_bytecode_cache(monkeypatch):
+    monkeypatch.delenv("APP_CONFIG", raising=False)
+    app = create_app()
+
+    assert app.debug
+    assert app.jinja_env.bytecode_cache is None
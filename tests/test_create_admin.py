@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from models import User
+
+SCRIPT = Path(__file__).resolve().parent.parent / "create_admin.py"
+
+
+def run_script(database_uri):
+    env = {**os.environ, "DATABASE_URL": database_uri}
+    return subprocess.run(
+        [sys.executable, str(SCRIPT)],
+        cwd=SCRIPT.parent,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_create_admin_on_initialised_database(app):
+    database_uri = app.config["SQLALCHEMY_DATABASE_URI"]
+
+    assert "успешно создан" in run_script(database_uri).stdout
+    assert "уже существует" in run_script(database_uri).stdout
+
+    with app.app_context():
+        admin = User.query.filter_by(email="admin@example.com").one()
+        assert admin.is_admin
+        assert admin.check_password("admin123")
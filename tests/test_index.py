@@ -0,0 +1,59 @@
+from datetime import date, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, raiseload
+
+from extensions import db
+from models import Hotel
+
+
+def test_index_has_no_lazy_loads(client, count_queries):
+    def forbid_lazy_loads(orm_execute_state):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            raiseload("*")
+        )
+
+    event.listen(Session, "do_orm_execute", forbid_lazy_loads)
+    try:
+        response = client.get("/")
+    finally:
+        event.remove(Session, "do_orm_execute", forbid_lazy_loads)
+
+    assert response.status_code == 200
+    assert "Отель Центр" in response.get_data(as_text=True)
+    # отели для фильтра, номера с занятостью, selectin-загрузка отелей номеров
+    assert len(count_queries) == 3
+
+
+def test_index_is_cached_for_guests(app, client):
+    assert "Отель Центр" in client.get("/").get_data(as_text=True)
+    with app.app_context():
+        Hotel.query.filter_by(name="Отель Центр").update({"name": "Переименован"})
+        db.session.commit()
+    # прямое изменение в БД без сброса кэша: гость видит закэшированную страницу
+    assert "Отель Центр" in client.get("/").get_data(as_text=True)
+
+
+def test_index_cache_is_invalidated_by_booking(app, auth_client):
+    guest = app.test_client()
+    assert "Занят сейчас" not in guest.get("/").get_data(as_text=True)
+
+    auth_client.post(
+        "/book/1",
+        data={
+            "check_in": date.today().isoformat(),
+            "check_out": (date.today() + timedelta(days=2)).isoformat(),
+        },
+    )
+
+    assert "Занят сейчас" in guest.get("/").get_data(as_text=True)
+
+
+def test_profile_param_does_not_bypass_cache_without_profiler(app, client):
+    assert not app.debug
+    client.get("/")
+    with app.app_context():
+        Hotel.query.filter_by(name="Отель Центр").update({"name": "Переименован"})
+        db.session.commit()
+
+    assert "Отель Центр" in client.get("/?profile=1").get_data(as_text=True)
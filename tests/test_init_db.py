@@ -0,0 +1,29 @@
+from datetime import date, timedelta
+
+from sqlalchemy import text
+
+from extensions import db
+from models import Booking
+
+
+def test_init_db_reports_duplicates_for_unique_index(app, user):
+    check_in = date.today()
+    with app.app_context():
+        db.session.execute(text("DROP INDEX uq_bookings_user_room_checkin"))
+        for nights in (1, 2):
+            db.session.add(
+                Booking(
+                    user_id=user,
+                    room_id=1,
+                    check_in=check_in,
+                    check_out=check_in + timedelta(days=nights),
+                    total_price=100,
+                )
+            )
+        db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=["init-db"])
+
+    assert result.exit_code == 1
+    assert "uq_bookings_user_room_checkin" in result.output
+    assert "Traceback" not in result.output